@@ -7,17 +7,78 @@ from strategies.strategy import Strategy
 from positionsizehandlers.position_size import PositionSizeHandler
 from loggers.logger import Logger
 from executionhandlers.execution_handler_factory import ExecutionHandlerFactory
-import time
+from collections import deque
 import datetime
 from core.worker import Worker
-
-try:
-    import Queue as queue
-except ImportError:
-    import queue
+from events.event_type import EventType
+
+
+# Source of the event loop of a symbol, specialized for every backtest once its instances exist
+_RUN_SYMBOL_SOURCE = '''
+def run_symbol(self, symbol):
+    events = self.events_per_symbol[symbol]
+    next_event = events.popleft
+    write_progress = self.write_progress
+    backtest_should_continue = self.data_handler.backtest_should_continue
+    update_bars = self.data_handler.update_bars
+    calculate_signals = self.strategy.calculate_signals
+    update_stop_and_limit_orders = self.execution_handler.update_stop_and_limit_orders
+    update_timeindex = self.portfolio.update_timeindex
+    update_signal = self.portfolio.update_signal
+    execute_order = self.execution_handler.execute_order
+    update_fill = self.portfolio.update_fill
+    clear_limit_or_stop_orders = self.execution_handler.clear_limit_or_stop_orders
+    log_event = self.log_event
+    progress_interval = self.PROGRESS_INTERVAL
+
+    i = 0
+    while True:
+        i += 1
+        if i % progress_interval == 0:
+            write_progress(i)
+
+        # Update the market bars
+        if backtest_should_continue(symbol):
+            update_bars(symbol)
+        else:
+            break
+
+        # Handle the events
+        while events:
+            event = next_event()
+
+            if event is not None:
+                type_id = event.type_id
+
+                if type_id == {market}:
+                    calculate_signals(event)
+                    update_stop_and_limit_orders(event)
+                    update_timeindex()
+                elif type_id == {signal}:
+                    self.signals += 1
+                    update_signal(event)
+                elif type_id == {order}:
+                    self.orders += 1
+                    execute_order(event)
+                elif type_id == {fill}:
+                    self.fills += 1
+                    update_fill(event)
+                elif type_id == {close_pending_orders}:
+                    clear_limit_or_stop_orders(event)
+{log_event}
+    write_progress(i)
+'''
+
+_LOG_EVENT_SOURCE = '''
+            log_event(i, event)
+'''
 
 
 class Backtest(Worker):
+
+    # Number of bars of a symbol between two progress updates, computing the progress is not free
+    PROGRESS_INTERVAL = 1000
+
     def __init__(
             self, output_directory: str, symbol_list: list, initial_capital: int, heartbeat: int, start_date: datetime,
             configuration: Configuration, data_handler_factory: DataHandlerFactory,
@@ -28,6 +89,7 @@ class Backtest(Worker):
         self.output_directory = output_directory
         self.symbol_list = symbol_list
         self.initial_capital = initial_capital
+        # Kept for the signature shared with Trading, a backtest never waits between bars
         self.heartbeat = heartbeat
         self.start_date = start_date
         self.configuration = configuration
@@ -42,8 +104,7 @@ class Backtest(Worker):
         self.equity_filename = equity_filename
         self.trades_filename = trades_filename
 
-        self.events = queue.Queue()
-        self.events_per_symbol = dict(((symbol, queue.Queue()) for (symbol) in self.symbol_list))
+        self.events_per_symbol = dict(((symbol, deque()) for (symbol) in self.symbol_list))
 
         self.signals = 0
         self.orders = 0
@@ -51,6 +112,10 @@ class Backtest(Worker):
 
         self.stats = None
 
+        self._disable_log_event_if_not_enabled()
+
+        self._last_progress = -1
+
         self._generate_trading_instances()
 
     def _generate_trading_instances(self):
@@ -60,7 +125,8 @@ class Backtest(Worker):
 
         self.portfolio = self.portfolio_class(self.data_handler, self.events_per_symbol, self.start_date,
                                               self.initial_capital, self.output_directory, self.equity_filename,
-                                              self.trades_filename, self.position_size_handler)
+                                              self.trades_filename, self.position_size_handler,
+                                              number_of_bars=self.data_handler.get_total_number_of_bars())
 
         self.strategy = self.strategy_class(self.data_handler, self.portfolio, self.events_per_symbol,
                                             **self.strategy_params_dict)
@@ -70,51 +136,39 @@ class Backtest(Worker):
                                                                                      self.events_per_symbol,
                                                                                      self.logger)
 
+        self._specialized_run_symbol = self._compile_run_symbol()
+
+    def _compile_run_symbol(self):
+        """
+        Generates the event loop of a symbol for this backtest. The instances
+        do not change during the run, so their methods are bound to locals
+        once, events are dispatched inline on their type ids and the logging
+        call is left out entirely when events are not logged.
+        """
+        source = _RUN_SYMBOL_SOURCE.format(
+            market=EventType.MARKET, signal=EventType.SIGNAL, order=EventType.ORDER, fill=EventType.FILL,
+            close_pending_orders=EventType.CLOSE_PENDING_ORDERS,
+            log_event=_LOG_EVENT_SOURCE if self._is_event_logging_enabled() else ''
+        )
+
+        namespace = {}
+        exec(compile(source, '<backtest run_symbol>', 'exec'), namespace)
+
+        return namespace['run_symbol'].__get__(self, type(self))
+
     def _run_symbol(self, symbol: str):
-        self.write_progress(0)
-
-        i = 0
-        while True:
-            i += 1
-            self.write_progress(i)
-
-            # Update the market bars
-            if self.data_handler.backtest_should_continue(symbol):
-                self.data_handler.update_bars(symbol)
-            else:
-                break
-
-            # Handle the events
-            while True:
-                try:
-                    event = self.events_per_symbol[symbol].get(False)
-                except queue.Empty:
-                    break
-                else:
-                    if event is not None:
-                        if event.type == 'CLOSE_PENDING_ORDERS':
-                            self.execution_handler.clear_limit_or_stop_orders(event)
-                        elif event.type == 'MARKET':
-                            self.strategy.calculate_signals(event)
-                            self.execution_handler.update_stop_and_limit_orders(event)
-                            self.portfolio.update_timeindex()
-                        elif event.type == 'SIGNAL':
-                            self.signals += 1
-                            self.portfolio.update_signal(event)
-                        elif event.type == 'ORDER':
-                            self.orders += 1
-                            self.execution_handler.execute_order(event)
-                        elif event.type == 'FILL':
-                            self.fills += 1
-                            self.portfolio.update_fill(event)
-
-                    self.log_event(i, event)
-
-            time.sleep(self.heartbeat)
+        self._specialized_run_symbol(symbol)
 
     def write_progress(self, iteration: int):
         progress = int(round(self.data_handler.get_position_in_percentage(), 0))
-        print('Running backtest ({}%)'.format(progress), end='\r')
+
+        # Only rewrite the line when the rounded percentage changes
+        if progress == self._last_progress:
+            return
+
+        self._last_progress = progress
+
+        sys.stdout.write('Running backtest ({}%)\r'.format(progress))
         sys.stdout.flush()
 
     def get_signals(self) -> int:
@@ -1,4 +1,7 @@
 import os
+import itertools
+import threading
+import numpy as np
 import pandas as pd
 from events.order_event import OrderEvent
 from events.fill_event import FillEvent
@@ -7,17 +10,18 @@ from core.perfomance import create_sharpe_ratio, create_drawdowns
 from core.stats import Stats
 from core.position import Position
 from typing import Dict
-
-try:
-    import Queue as queue
-except ImportError:
-    import queue
+from typing import Optional
+from collections import deque
 
 
 class Portfolio(object):
-    def __init__(self, bars, events_per_symbol: Dict[str, queue.Queue], start_date,
+
+    # Rows of the equity arrays allocated first when the number of bars is not known up front
+    INITIAL_NUMBER_OF_ROWS = 1024
+
+    def __init__(self, bars, events_per_symbol: Dict[str, deque], start_date,
                  initial_capital, output_directory, equity_filename, trades_filename,
-                 position_size_handler) -> None:
+                 position_size_handler, number_of_bars: Optional[int] = None) -> None:
         self.bars = bars
         self.events_per_symbol = events_per_symbol
         self.symbol_list = self.bars.symbol_list
@@ -28,32 +32,61 @@ class Portfolio(object):
         self.trades_filename = trades_filename
         self.position_size_handler = position_size_handler
 
-        self.all_positions = self.construct_all_positions()
-
         self.current_positions = dict((k, v) for k, v in \
                                       [(s, None) for s in self.symbol_list])
 
-        self.all_holdings = self.construct_all_holdings()
+        self.construct_equity_arrays(number_of_bars)
         self.current_holdings = self.construct_current_holdings()
         self.trades = {}
 
     def get_current_position(self, symbol):
         return self.current_positions[symbol]
 
-    def construct_all_positions(self):
-        d = dict((k, v) for k, v in [(s, None) for s in self.symbol_list])
-        d['datetime'] = self.start_date
+    def construct_equity_arrays(self, number_of_bars: Optional[int]):
+        """
+        Allocates the rows of the equity curve, the initial one and one
+        per market event. With a known number of bars (backtests) the
+        arrays are never resized and rows are written without locking,
+        otherwise they grow on demand under a lock.
+        """
+        if number_of_bars is None:
+            number_of_rows = self.INITIAL_NUMBER_OF_ROWS
+            self._equity_lock = threading.Lock()
+        else:
+            number_of_rows = number_of_bars + 1
+            self._equity_lock = None
 
-        return [d]
+        number_of_symbols = len(self.symbol_list)
 
-    def construct_all_holdings(self):
-        d = dict((k, v) for k, v in [(s, 0.0) for s in self.symbol_list])
-        d['datetime'] = self.start_date
-        d['cash'] = self.initial_capital
-        d['commission'] = 0.0
-        d['total'] = self.initial_capital
+        self._datetimes = np.empty(number_of_rows, dtype=object)
+        # Market values of the symbols followed by the cash, commission and total columns
+        self._holdings = np.zeros((number_of_rows, number_of_symbols + 3), dtype=np.float64)
 
-        return [d]
+        self._datetimes[0] = self.start_date
+        self._holdings[0, number_of_symbols:] = (self.initial_capital, 0.0, self.initial_capital)
+
+        # next() of itertools.count is atomic, so the threads of the symbols never share a row
+        self._rows = itertools.count(1)
+
+    def _grow_equity_arrays(self):
+        number_of_rows = len(self._datetimes)
+
+        datetimes = np.empty(2 * number_of_rows, dtype=object)
+        holdings = np.zeros((2 * number_of_rows, self._holdings.shape[1]), dtype=np.float64)
+
+        datetimes[:number_of_rows] = self._datetimes
+        holdings[:number_of_rows] = self._holdings
+
+        self._datetimes = datetimes
+        self._holdings = holdings
+
+    def get_number_of_equity_rows(self) -> int:
+        """
+        Returns the number of rows written to the equity arrays, those
+        having a datetime set. Meant to be called once the workers are
+        done, when every reserved row has been written.
+        """
+        return int(np.count_nonzero(pd.notnull(self._datetimes)))
 
     def construct_current_holdings(self):
         d = dict((k, v) for k, v in [(s, 0.0) for s in self.symbol_list])
@@ -72,26 +105,22 @@ class Portfolio(object):
                 if latest_datetime is None or latest_datetime < latest_datetime_for_symbol:
                     latest_datetime = latest_datetime_for_symbol
 
-        # Update positions
-        # ================
-        dp = dict((k, v) for k, v in [(s, 0) for s in self.symbol_list])
-        dp['datetime'] = latest_datetime
+        if self._equity_lock is None:
+            self._write_equity_row(next(self._rows), latest_datetime)
+        else:
+            with self._equity_lock:
+                row = next(self._rows)
 
-        for s in self.symbol_list:
-            dp[s] = self.get_current_position(s)
+                if row == len(self._datetimes):
+                    self._grow_equity_arrays()
 
-        # Append the current positions
-        self.all_positions.append(dp)
+                self._write_equity_row(row, latest_datetime)
 
-        # Update holdings
-        # ===============
-        dh = dict((k, v) for k, v in [(s, 0) for s in self.symbol_list])
-        dh['datetime'] = latest_datetime
-        dh['cash'] = self.current_holdings['cash']
-        dh['commission'] = self.current_holdings['commission']
-        dh['total'] = self.current_holdings['cash']
+    def _write_equity_row(self, row: int, latest_datetime):
+        holdings = self._holdings[row]
+        total = self.current_holdings['cash']
 
-        for s in self.symbol_list:
+        for i, s in enumerate(self.symbol_list):
             # Approximation to the real value
             position = self.get_current_position(s)
             if position is not None:
@@ -99,11 +128,15 @@ class Portfolio(object):
             else:
                 market_value = 0
 
-            dh[s] = market_value
-            dh['total'] += market_value
+            holdings[i] = market_value
+            total += market_value
 
-        # Append the current holdings
-        self.all_holdings.append(dh)
+        number_of_symbols = len(self.symbol_list)
+        holdings[number_of_symbols] = self.current_holdings['cash']
+        holdings[number_of_symbols + 1] = self.current_holdings['commission']
+        holdings[number_of_symbols + 2] = total
+
+        self._datetimes[row] = latest_datetime
 
     def update_positions_from_fill(self, fill):
 
@@ -224,15 +257,18 @@ class Portfolio(object):
             order_event = self.generate_naive_order(event)
 
             if order_event is not None:
-                self.events_per_symbol[order_event.symbol].put(order_event)
+                self.events_per_symbol[order_event.symbol].append(order_event)
 
             if event.signal_type == 'EXIT':
                 close_pending_orders_event = ClosePendingOrdersEvent(event.symbol)
-                self.events_per_symbol[close_pending_orders_event.symbol].put(close_pending_orders_event)
+                self.events_per_symbol[close_pending_orders_event.symbol].append(close_pending_orders_event)
 
     def create_equity_curve_dataframe(self):
-        curve = pd.DataFrame(self.all_holdings)
-        curve.set_index('datetime', inplace=True)
+        number_of_rows = self.get_number_of_equity_rows()
+
+        curve = pd.DataFrame(self._holdings[:number_of_rows], copy=False,
+                             index=pd.Index(self._datetimes[:number_of_rows], name='datetime'),
+                             columns=list(self.symbol_list) + ['cash', 'commission', 'total'])
         curve['returns'] = curve['total'].pct_change()
         curve['equity_curve'] = (1.0 + curve['returns']).cumprod()
         self.equity_curve = curve
@@ -12,14 +12,13 @@ from strategies.strategy import Strategy
 import os
 from core.worker import Worker
 import time
-
-try:
-    import Queue as queue
-except ImportError:
-    import queue
+from collections import deque
 
 
 class Trading(Worker):
+
+    MAX_BARS_PER_WAKEUP = 64
+
     def __init__(self, output_directory: str, symbol_list: list, heartbeat: int, configuration: Configuration,
                  data_handler_factory: DataHandlerFactory, execution_handler_factory: ExecutionHandlerFactory,
                  portfolio_class: Type[Portfolio], strategy_class: Type[Strategy],
@@ -44,7 +43,7 @@ class Trading(Worker):
         self.start_date = datetime.datetime.now()
         self.initial_capital = 0
 
-        self.events_per_symbol = dict(((symbol, queue.Queue()) for (symbol) in self.symbol_list))
+        self.events_per_symbol = dict(((symbol, deque()) for (symbol) in self.symbol_list))
 
         self.signals = 0
         self.orders = 0
@@ -52,6 +51,8 @@ class Trading(Worker):
 
         self.stats = None
 
+        self._disable_log_event_if_not_enabled()
+
         summary_file = os.path.join(self.output_directory, 'output_summary.txt')
         self.output_summary_file = open(summary_file, 'w')
 
@@ -82,6 +83,22 @@ class Trading(Worker):
             i += 1
             self.write_progress(i)
 
+            if not self._process_available_bars(symbol, i):
+                break
+
+            if self.heartbeat:
+                time.sleep(self.heartbeat)
+
+        self.log_message(i, 'Stopping processing pair {}'.format(symbol))
+
+    def _process_available_bars(self, symbol: str, iteration: int) -> bool:
+        """
+        Waits for the next bar of the symbol and then keeps processing the bars
+        which are already waiting (up to MAX_BARS_PER_WAKEUP), so the progress
+        output and the heartbeat are handled once per batch instead of per bar.
+        Returns False when no more bars will come for the symbol.
+        """
+        for _ in range(self.MAX_BARS_PER_WAKEUP):
             # Update the market bars
             if self.data_handler.backtest_should_continue(symbol):
                 self.data_handler.update_bars(symbol)
@@ -91,36 +108,36 @@ class Trading(Worker):
                 if self.get_logger() is not None and error_message is not None:
                     self.get_logger().write(error_message)
 
+                return False
+
+            events = self.events_per_symbol[symbol]
+
+            while events:
+                event = events.popleft()
+
+                if event is not None:
+                    if event.type == 'CLOSE_PENDING_ORDERS':
+                        self.execution_handler.clear_limit_or_stop_orders(event)
+                    elif event.type == 'MARKET':
+                        self.strategy.calculate_signals(event)
+                        self.execution_handler.update_stop_and_limit_orders(event)
+                        self.portfolio.update_timeindex()
+                    elif event.type == 'SIGNAL':
+                        self.signals += 1
+                        self.portfolio.update_signal(event)
+                    elif event.type == 'ORDER':
+                        self.orders += 1
+                        self.execution_handler.execute_order(event)
+                    elif event.type == 'FILL':
+                        self.fills += 1
+                        self.portfolio.update_fill(event)
+
+                self.log_event(iteration, event)
+
+            if not self.data_handler.has_pending_bars(symbol):
                 break
 
-            while True:
-                try:
-                    event = self.events_per_symbol[symbol].get(False)
-                except queue.Empty:
-                    break
-                else:
-                    if event is not None:
-                        if event.type == 'CLOSE_PENDING_ORDERS':
-                            self.execution_handler.clear_limit_or_stop_orders(event)
-                        elif event.type == 'MARKET':
-                            self.strategy.calculate_signals(event)
-                            self.execution_handler.update_stop_and_limit_orders(event)
-                            self.portfolio.update_timeindex()
-                        elif event.type == 'SIGNAL':
-                            self.signals += 1
-                            self.portfolio.update_signal(event)
-                        elif event.type == 'ORDER':
-                            self.orders += 1
-                            self.execution_handler.execute_order(event)
-                        elif event.type == 'FILL':
-                            self.fills += 1
-                            self.portfolio.update_fill(event)
-
-                    self.log_event(i, event)
-
-            time.sleep(self.heartbeat)
-
-        self.log_message(i, 'Stopping processing pair {}'.format(symbol))
+        return True
 
     def write_progress(self, iteration: int):
         number_of_bars_for_symbols = []
@@ -86,6 +86,20 @@ class Worker(object):
 
             self.log_message(iteration, log)
 
+    def _skip_log_event(self, iteration, event):
+        pass
+
+    def _is_event_logging_enabled(self) -> bool:
+        return self.get_logger() is not None and self.LOG_TYPE_EVENTS in self.get_enabled_log_types()
+
+    def _disable_log_event_if_not_enabled(self):
+        """
+        Rebinds log_event to a no-op when events are not logged, so the
+        event loop does not re-check the logger for every event.
+        """
+        if not self._is_event_logging_enabled():
+            self.log_event = self._skip_log_event
+
     def _save_equity_and_generate_stats(self):
         print('Starting to generate equity')
         sys.stdout.flush()
@@ -25,6 +25,14 @@ class DataHandler(object):
     def backtest_should_continue(self, symbol: str) -> bool:
         raise NotImplementedError("Should implement backtest_should_continue()")
 
+    @abstractmethod
+    def has_pending_bars(self, symbol: str) -> bool:
+        """
+        Returns True when the next bar of the symbol is
+        available without waiting for it.
+        """
+        raise NotImplementedError("Should implement has_pending_bars()")
+
     @abstractmethod
     def has_some_bars(self, symbol: str) -> bool:
         raise NotImplementedError("Should implement has_some_bars()")
@@ -67,6 +75,23 @@ class DataHandler(object):
         """
         raise NotImplementedError("Should implement get_latest_bars_values()")
 
+    @abstractmethod
+    def get_all_bars_values(self, symbol, val_type):
+        """
+        Returns the values of all bars of the symbol, including
+        those not pushed yet, when the whole history is known up
+        front (historic data). Returns None otherwise.
+        """
+        raise NotImplementedError("Should implement get_all_bars_values()")
+
+    @abstractmethod
+    def get_total_number_of_bars(self) -> Optional[int]:
+        """
+        Returns the number of bars of all symbols together which
+        will be pushed, or None when it is not known up front.
+        """
+        raise NotImplementedError("Should implement get_total_number_of_bars()")
+
     @abstractmethod
     def update_bars(self, symbol: str):
         """
@@ -5,19 +5,15 @@ from datahandlers.oanda_data_handler import DataHandler
 from core.configuration import Configuration
 from oanda.instrument_api_client import InstrumentApiClient
 from typing import Dict
+from collections import deque
 from datahandlers.bars_provider.oanda_bars_provider_api import OandaBarsProviderApi
 from timeframe.timeframe import TimeFrame
 from loggers.logger import Logger
 
-try:
-    import Queue as queue
-except ImportError:
-    import queue
-
 
 class DataHandlerFactory:
     @staticmethod
-    def create_from_settings(configuration: Configuration, events_per_symbol: Dict[str, queue.Queue],
+    def create_from_settings(configuration: Configuration, events_per_symbol: Dict[str, deque],
                              symbol_list: list, logger: Logger) -> DataHandler:
 
         if configuration.data_handler_name == HistoricCSVDataHandler:
@@ -39,12 +35,12 @@ class DataHandlerFactory:
         raise Exception('Unknown DataHandler for {}'.format(configuration.data_handler_name))
 
     @staticmethod
-    def create_historic_csv_data_handler(events_per_symbol: Dict[str, queue.Queue],
+    def create_historic_csv_data_handler(events_per_symbol: Dict[str, deque],
                                          symbol_list: list, csv_dir: str) -> DataHandler:
         return HistoricCSVDataHandler(events_per_symbol, csv_dir, symbol_list)
 
     @staticmethod
-    def create_oanda_data_handler(events_per_symbol: Dict[str, queue.Queue], symbol_list: list, access_token: str,
+    def create_oanda_data_handler(events_per_symbol: Dict[str, deque], symbol_list: list, access_token: str,
                                   time_frame: str, number_of_bars_preload_from_history: int,
                                   logger: Logger) -> DataHandler:
         instrument_api_client = InstrumentApiClient(access_token)
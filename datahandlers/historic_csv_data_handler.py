@@ -6,14 +6,10 @@ import pandas.io.parsers
 from events.market_event import MarketEvent
 from datahandlers.data_handler import DataHandler
 from typing import Dict
+from collections import deque
 from typing import List
 from typing import Optional
 
-try:
-    import Queue as queue
-except ImportError:
-    import queue
-
 
 class HistoricCSVDataHandler(DataHandler):
     """
@@ -23,7 +19,17 @@ class HistoricCSVDataHandler(DataHandler):
     trading interface.
     """
 
-    def __init__(self, events_per_symbol: Dict[str, queue.Queue], csv_dir: str,
+    COLUMN_NAMES = ['datetime', 'open_bid', 'open_ask', 'high_bid', 'high_ask', 'low_bid', 'low_ask', 'close_bid',
+                    'close_ask', 'volume']
+
+    # Declared up front so the C parser does not have to infer them. Volume is a float so that
+    # files with an empty or fractional volume still load (as they did with inferred dtypes).
+    COLUMN_DTYPES = dict(
+        open_bid=np.float64, open_ask=np.float64, high_bid=np.float64, high_ask=np.float64, low_bid=np.float64,
+        low_ask=np.float64, close_bid=np.float64, close_ask=np.float64, volume=np.float64
+    )
+
+    def __init__(self, events_per_symbol: Dict[str, deque], csv_dir: str,
                  symbol_list: List[str]) -> None:
         """
         Initialises the historic data handler by requesting
@@ -37,6 +43,7 @@ class HistoricCSVDataHandler(DataHandler):
         self.symbol_list = symbol_list
 
         self.symbol_data = {}
+        self.symbol_frames = {}
         self.symbol_position_info = {}
         self.latest_symbol_data = {}
         self.continue_backtest_per_symbols = dict(((symbol, True) for (symbol) in self.symbol_list))
@@ -49,6 +56,16 @@ class HistoricCSVDataHandler(DataHandler):
     def backtest_should_continue(self, symbol: str):
         return self.continue_backtest_per_symbols[symbol]
 
+    def _read_csv_file(self, symbol, **kwargs):
+        """
+        Loads the CSV file of the symbol with no header information, indexed on date.
+        """
+        return pd.io.parsers.read_csv(
+            os.path.join(self.csv_dir, '%s.csv' % symbol),
+            header=2, index_col=0, parse_dates=True, delimiter=';', names=self.COLUMN_NAMES,
+            dtype=self.COLUMN_DTYPES, engine='c', low_memory=False, memory_map=True, **kwargs
+        )
+
     def _open_convert_csv_files(self):
         """
         Opens the CSV files from the data directory, converting
@@ -59,13 +76,7 @@ class HistoricCSVDataHandler(DataHandler):
         """
         comb_index = None
         for s in self.symbol_list:
-            # Load the CSV file with no header information, indexed on date
-            self.symbol_data[s] = pd.io.parsers.read_csv(
-                os.path.join(self.csv_dir, '%s.csv' % s),
-                header=2, index_col=0, parse_dates=True, delimiter=';',
-                names=['datetime', 'open_bid', 'open_ask', 'high_bid', 'high_ask', 'low_bid', 'low_ask', 'close_bid',
-                       'close_ask', 'volume']
-            ).sort_index()
+            self.symbol_data[s] = self._read_csv_file(s).sort_index()
 
             self.symbol_position_info[s] = dict(
                 number_of_items = self.symbol_data[s].shape[0],
@@ -83,7 +94,8 @@ class HistoricCSVDataHandler(DataHandler):
 
         # Reindex the dataframes
         for s in self.symbol_list:
-            self.symbol_data[s] = self.symbol_data[s].reindex(index=comb_index, method='pad').iterrows()
+            self.symbol_frames[s] = self.symbol_data[s].reindex(index=comb_index, method='pad')
+            self.symbol_data[s] = self.symbol_frames[s].iterrows()
 
     def _get_new_bar(self, symbol):
         """
@@ -94,6 +106,9 @@ class HistoricCSVDataHandler(DataHandler):
             self.symbol_position_info[symbol]['position'] = self.symbol_position_info[symbol]['position'] + 1
             yield b
 
+    def has_pending_bars(self, symbol: str) -> bool:
+        return self.continue_backtest_per_symbols[symbol]
+
     def has_some_bars(self, symbol: str) -> bool:
         return symbol in self.latest_symbol_data and len(self.latest_symbol_data[symbol]) > 0
 
@@ -160,6 +175,12 @@ class HistoricCSVDataHandler(DataHandler):
         else:
             return np.array([getattr(b[1], val_type) for b in bars_list])
 
+    def get_all_bars_values(self, symbol, val_type):
+        return self.symbol_frames[symbol][val_type].values
+
+    def get_total_number_of_bars(self) -> Optional[int]:
+        return sum(frame.shape[0] for frame in self.symbol_frames.values())
+
     def update_bars(self, symbol: str):
         """
         Pushes the latest bar to the latest_symbol_data structure
@@ -172,7 +193,7 @@ class HistoricCSVDataHandler(DataHandler):
         else:
             if bar is not None:
                 self.latest_symbol_data[symbol].append(bar)
-                self.events_per_symbol[symbol].put(MarketEvent(symbol))
+                self.events_per_symbol[symbol].append(MarketEvent(symbol))
 
     def get_position_in_percentage(self):
         positions_in_percentage = list()
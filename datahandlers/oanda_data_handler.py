@@ -5,19 +5,15 @@ from dateutil import parser
 from oanda.instrument_api_client import InstrumentApiClient
 import asyncio
 from typing import Dict
+from collections import deque
 from typing import Optional
 from datahandlers.data_handler import DataHandler
 from datahandlers.bars_provider.bars_provider import BarsProvider
 
-try:
-    import Queue as queue
-except ImportError:
-    import queue
-
 
 class OandaDataHandler(DataHandler):
 
-    def __init__(self, events_per_symbol: Dict[str, queue.Queue], symbol_list: list, bars_provider: BarsProvider,
+    def __init__(self, events_per_symbol: Dict[str, deque], symbol_list: list, bars_provider: BarsProvider,
                  instrument_api_client: InstrumentApiClient, time_frame: str,
                  number_of_bars_preload_from_history: int) -> None:
 
@@ -130,6 +126,9 @@ class OandaDataHandler(DataHandler):
 
         self.latest_symbol_data[symbol].append(data)
 
+    def has_pending_bars(self, symbol: str) -> bool:
+        return not self.bars_provider.get_queue(symbol).empty()
+
     def has_some_bars(self, symbol: str) -> bool:
         return symbol in self.latest_symbol_data and len(self.latest_symbol_data[symbol]) > 0
 
@@ -196,6 +195,12 @@ class OandaDataHandler(DataHandler):
         else:
             return np.array([b[val_type] for b in bars_list])
 
+    def get_all_bars_values(self, symbol, val_type):
+        return None
+
+    def get_total_number_of_bars(self) -> Optional[int]:
+        return None
+
     def update_bars(self, symbol: str):
         """
         Pushes the latest bar to the latest_symbol_data structure
@@ -209,7 +214,7 @@ class OandaDataHandler(DataHandler):
         else:
             if bar is not None:
                 self.append_new_price_data(symbol, bar)
-                self.events_per_symbol[symbol].put(MarketEvent(symbol))
+                self.events_per_symbol[symbol].append(MarketEvent(symbol))
 
     def get_error_message(self) -> Optional[str]:
         return self.error_message
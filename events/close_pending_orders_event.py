@@ -2,6 +2,8 @@ from events.event import Event
 
 
 class ClosePendingOrdersEvent(Event):
+    __slots__ = ()
+
     def __init__(self, symbol: str) -> None:
 
         super().__init__('CLOSE_PENDING_ORDERS', symbol)
@@ -1,11 +1,15 @@
 from abc import ABCMeta, abstractmethod
+from events.event_type import EventType
 
 
 class Event(object):
     __metaclass__ = ABCMeta
 
+    __slots__ = ('_type', '_type_id', '_symbol')
+
     def __init__(self, event_type: str, symbol: str):
         self._type = event_type
+        self._type_id = EventType.get_id(event_type)
         self._symbol = symbol
 
     @abstractmethod
@@ -19,6 +23,11 @@ class Event(object):
     @type.setter
     def type(self, val: str) -> None:
         self._type = val
+        self._type_id = EventType.get_id(val)
+
+    @property
+    def type_id(self) -> int:
+        return self._type_id
 
     @property
     def symbol(self) -> str:
@@ -0,0 +1,18 @@
+class EventType(object):
+    MARKET = 0
+    SIGNAL = 1
+    ORDER = 2
+    FILL = 3
+    CLOSE_PENDING_ORDERS = 4
+
+    EVENT_TYPE_IDS = {
+        'MARKET': MARKET,
+        'SIGNAL': SIGNAL,
+        'ORDER': ORDER,
+        'FILL': FILL,
+        'CLOSE_PENDING_ORDERS': CLOSE_PENDING_ORDERS,
+    }
+
+    @staticmethod
+    def get_id(event_type: str) -> int:
+        return EventType.EVENT_TYPE_IDS[event_type]
@@ -4,6 +4,8 @@ from typing import Optional
 
 
 class FillEvent(Event):
+    __slots__ = ('time_index', 'exchange', 'quantity', 'direction', 'commission', 'fill_cost', 'trade_id')
+
     def __init__(self, time_index: datetime, symbol: str, exchange: str, quantity: float, direction: str,
                  fill_cost: Optional[float] = None, commission: Optional[float] = None, trade_id: Optional[int] = None):
 
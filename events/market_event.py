@@ -2,6 +2,8 @@ from events.event import Event
 
 
 class MarketEvent(Event):
+    __slots__ = ()
+
     def __init__(self, symbol: str):
         super().__init__('MARKET', symbol)
 
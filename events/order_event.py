@@ -2,6 +2,8 @@ from events.event import Event
 
 
 class OrderEvent(Event):
+    __slots__ = ('order_type', 'quantity', 'direction', 'stop_loss', 'take_profit', 'price', 'note',
+                 'trade_id_related_to', 'trade_to_exit_direction')
 
     def __init__(self, symbol, order_type, quantity, direction, stop_loss=None, take_profit=None, price=None,
                  note=None, trade_id_related_to=None, trade_to_exit_direction=None):
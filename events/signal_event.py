@@ -2,6 +2,9 @@ from events.event import Event
 
 
 class SignalEvent(Event):
+    __slots__ = ('strategy_id', 'bar_datetime', 'datetime', 'signal_type', 'strength', 'stop_loss', 'take_profit',
+                 'trade_id_to_exit')
+
     def __init__(self, strategy_id, symbol, bar_datetime, datetime, signal_type, strength, stop_loss=None,
                  take_profit=None, trade_id_to_exit=None):
         """
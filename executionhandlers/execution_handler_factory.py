@@ -5,11 +5,7 @@ from core.configuration import Configuration
 from datahandlers.data_handler import DataHandler
 from loggers.logger import Logger
 from typing import Dict
-
-try:
-    import Queue as queue
-except ImportError:
-    import queue
+from collections import deque
 
 
 class ExecutionHandlerFactory:
@@ -18,7 +14,7 @@ class ExecutionHandlerFactory:
 
     @staticmethod
     def create_from_settings(configuration: Configuration, data_handler: DataHandler,
-                             events_per_symbol: Dict[str, queue.Queue], logger: Logger) -> ExecutionHandler:
+                             events_per_symbol: Dict[str, deque], logger: Logger) -> ExecutionHandler:
 
         if configuration.execution_handler_name == SimulatedExecutionHandler:
             return ExecutionHandlerFactory.create_historic_csv_execution_handler(data_handler, events_per_symbol)
@@ -35,11 +31,11 @@ class ExecutionHandlerFactory:
 
     @staticmethod
     def create_historic_csv_execution_handler(data_handler,
-                                              events_per_symbol: Dict[str, queue.Queue]) -> ExecutionHandler:
+                                              events_per_symbol: Dict[str, deque]) -> ExecutionHandler:
         return SimulatedExecutionHandler(data_handler, events_per_symbol)
 
     @staticmethod
-    def create_oanda_execution_handler(data_handler: DataHandler, events_per_symbol: Dict[str, queue.Queue],
+    def create_oanda_execution_handler(data_handler: DataHandler, events_per_symbol: Dict[str, deque],
                                        account_id: str, access_token: str,
                                        logger: Logger) -> ExecutionHandler:
         return OandaExecutionHandler(data_handler, events_per_symbol, account_id, access_token, logger)
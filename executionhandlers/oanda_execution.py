@@ -7,16 +7,12 @@ from oanda.order_api_client import OrderApiClient
 from oanda.trade_api_client import TradeApiClient
 from loggers.logger import Logger
 from typing import Dict
+from collections import deque
 from datahandlers.data_handler import DataHandler
 
-try:
-    import Queue as queue
-except ImportError:
-    import queue
-
 
 class OandaExecutionHandler(ExecutionHandler):
-    def __init__(self, bars: DataHandler, events_per_symbol: Dict[str, queue.Queue],
+    def __init__(self, bars: DataHandler, events_per_symbol: Dict[str, deque],
                  account_id: str, access_token: str, logger: Logger):
         self.bars = bars
         self.events_per_symbol = events_per_symbol
@@ -57,7 +53,7 @@ class OandaExecutionHandler(ExecutionHandler):
                             None, 0
                         )
 
-                        self.events_per_symbol[fill_event.symbol].put(fill_event)
+                        self.events_per_symbol[fill_event.symbol].append(fill_event)
 
                     self.logger.write(
                         'Error during executing the order: errorCode=%s, errorMessage="%s"' % (
@@ -87,7 +83,7 @@ class OandaExecutionHandler(ExecutionHandler):
                         'Executed the order with stopLoss=%10.5f, takeProfit=%10.5f' % (
                             stop_loss, take_profit))
 
-                    self.events_per_symbol[fill_event.symbol].put(fill_event)
+                    self.events_per_symbol[fill_event.symbol].append(fill_event)
 
     def update_stop_and_limit_orders(self, market_event):
         pass
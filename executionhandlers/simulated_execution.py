@@ -7,15 +7,11 @@ from events.close_pending_orders_event import ClosePendingOrdersEvent
 from datahandlers.data_handler import DataHandler
 import copy
 from typing import Dict
-
-try:
-    import Queue as queue
-except ImportError:
-    import queue
+from collections import deque
 
 
 class SimulatedExecutionHandler(ExecutionHandler):
-    def __init__(self, bars: DataHandler, events_per_symbol: Dict[str, queue.Queue]):
+    def __init__(self, bars: DataHandler, events_per_symbol: Dict[str, deque]):
         self.bars = bars
         self.events_per_symbol = events_per_symbol
         self.limit_and_stop_orders = list()
@@ -45,7 +41,7 @@ class SimulatedExecutionHandler(ExecutionHandler):
                     datetime.datetime.utcnow(), event.symbol, 'FOREX', event.quantity, event.direction, None, None,
                     trade_id
                 )
-                self.events_per_symbol[event.symbol].put(fill_event)
+                self.events_per_symbol[event.symbol].append(fill_event)
 
                 reversed_direction = self.get_reversed_direction(event.direction)
 
@@ -63,6 +59,10 @@ class SimulatedExecutionHandler(ExecutionHandler):
 
     def update_stop_and_limit_orders(self, market_event):
         for order in self.limit_and_stop_orders:
+            # Only the pending orders of the symbol which got the new bar, the bars of the other
+            # symbols may be processed by other threads at the same time
+            if order.symbol != market_event.symbol:
+                continue
 
             price_bid = self.bars.get_latest_bar_value(order.symbol, 'close_bid')
             price_ask = self.bars.get_latest_bar_value(order.symbol, 'close_ask')
@@ -79,10 +79,10 @@ class SimulatedExecutionHandler(ExecutionHandler):
 
             if should_be_filled:
                 new_order = self.make_pending_order_market(order, note)
-                self.events_per_symbol[new_order.symbol].put(new_order)
+                self.events_per_symbol[new_order.symbol].append(new_order)
 
                 close_pending_orders_event = ClosePendingOrdersEvent(order.symbol)
-                self.events_per_symbol[close_pending_orders_event.symbol].put(close_pending_orders_event)
+                self.events_per_symbol[close_pending_orders_event.symbol].append(close_pending_orders_event)
 
     def stop_order_should_be_filled(self, order, price_ask, price_bid):
         return (order.direction == 'BUY' and price_ask >= order.price) or \
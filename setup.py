@@ -17,4 +17,7 @@ setup(
         'numpy>=1.14.2',
         'scikit_learn>=0.19.1'
     ],
+    extras_require={
+        'jit': ['numba']
+    },
 )
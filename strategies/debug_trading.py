@@ -5,17 +5,13 @@ from events.signal_event import SignalEvent
 from strategies.strategy import Strategy
 import argparser_tools.basic
 from typing import Dict
+from collections import deque
 from datahandlers.data_handler import DataHandler
 from core.portfolio import Portfolio
 
-try:
-    import Queue as queue
-except ImportError:
-    import queue
-
 
 class DebugTradingStrategy(Strategy):
-    def __init__(self, bars: DataHandler, portfolio: Portfolio, events_per_symbol: Dict[str, queue.Queue],
+    def __init__(self, bars: DataHandler, portfolio: Portfolio, events_per_symbol: Dict[str, deque],
                  signal_file: str, stop_loss_pips=None, take_profit_pips=None):
 
         self.bars = bars
@@ -36,11 +32,11 @@ class DebugTradingStrategy(Strategy):
     def _calculate_initial_bought(self):
         """
         Adds keys to the bought dictionary for all symbols
-        and sets them to 'OUT'.
+        and sets them to OUT.
         """
         bought = {}
         for s in self.symbol_list:
-            bought[s] = 'OUT'
+            bought[s] = self.OUT
 
         return bought
 
@@ -52,12 +48,7 @@ class DebugTradingStrategy(Strategy):
                 return
 
             if self.portfolio.current_positions[symbol] == 0:
-                self.bought[symbol] = 'OUT'
-
-            bar_date = self.bars.get_latest_bar_datetime(symbol)
-            bar_price = self.bars.get_latest_bar_value(symbol, 'close_bid')
-
-            dt = datetime.datetime.utcnow()
+                self.bought[symbol] = self.OUT
 
             self.signal_file_opened.seek(0, 0)
             signal_from_file = self.signal_file_opened.readline()
@@ -66,6 +57,15 @@ class DebugTradingStrategy(Strategy):
             short_signal = signal_from_file == 'short'
             exit_signal = signal_from_file == 'exit'
 
+            # Nothing can be emitted without a signal in the file, skip reading the bar and the clock
+            if not (long_signal or short_signal or exit_signal):
+                return
+
+            bar_date = self.bars.get_latest_bar_datetime(symbol)
+            bar_price = self.bars.get_latest_bar_value(symbol, 'close_bid')
+
+            dt = datetime.datetime.utcnow()
+
             signal_generated = self.calculate_exit_signals(short_signal, long_signal, exit_signal, symbol, bar_date,
                                                            dt)
 
@@ -83,8 +83,8 @@ class DebugTradingStrategy(Strategy):
             take_profit = self.calculate_take_profit_price(bar_price, self.take_profit_pips, sig_dir)
 
             signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0, stop_loss, take_profit)
-            self.events_per_symbol[symbol].put(signal)
-            self.bought[symbol] = sig_dir
+            self.events_per_symbol[symbol].append(signal)
+            self.bought[symbol] = self.LONG
 
             return True
 
@@ -95,8 +95,8 @@ class DebugTradingStrategy(Strategy):
             take_profit = self.calculate_take_profit_price(bar_price, self.take_profit_pips, sig_dir)
 
             signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0, stop_loss, take_profit)
-            self.events_per_symbol[symbol].put(signal)
-            self.bought[symbol] = sig_dir
+            self.events_per_symbol[symbol].append(signal)
+            self.bought[symbol] = self.SHORT
 
             return True
 
@@ -112,9 +112,9 @@ class DebugTradingStrategy(Strategy):
             sig_dir = 'EXIT'
 
             signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0, None, None, current_position.get_trade_id())
-            self.events_per_symbol[symbol].put(signal)
+            self.events_per_symbol[symbol].append(signal)
 
-            self.bought[symbol] = 'OUT'
+            self.bought[symbol] = self.OUT
 
             return True
 
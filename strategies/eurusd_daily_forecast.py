@@ -21,24 +21,20 @@ from datahandlers.data_handler import DataHandler
 import argparser_tools.basic
 from events.event import Event
 from typing import Dict
+from collections import deque
 
 import numpy as np
 
-try:
-    import Queue as queue
-except ImportError:
-    import queue
-
 
 class EurUsdDailyForecastStrategy(Strategy):
-    def __init__(self, bars: DataHandler, portfolio: Portfolio, events_per_symbol: Dict[str, queue.Queue],
+    def __init__(self, bars: DataHandler, portfolio: Portfolio, events_per_symbol: Dict[str, deque],
                  trained_model_file=None, train_data=None, model_output_file=None, model_start_date=None,
                  stop_loss_pips=None, take_profit_pips=None, sma_short_period=None, sma_long_period=None):
         """
 
         :type bars: DataHandler
         :type portfolio: Portfolio
-        :type events: queue.Queue
+        :type events_per_symbol: Dict[str, deque]
         :type trained_model_file: str
         :type train_data: str
         :type model_output_file: str
@@ -84,7 +80,7 @@ class EurUsdDailyForecastStrategy(Strategy):
     def _calculate_initial_bought(self):
         bought = {}
         for s in self.symbol_list:
-            bought[s] = 'OUT'
+            bought[s] = self.OUT
 
         return bought
 
@@ -179,7 +175,7 @@ class EurUsdDailyForecastStrategy(Strategy):
         if event.type == 'MARKET' and (symbol == 'EUR_USD' or symbol == 'eurusd'):
 
             if self.portfolio.current_positions[symbol] == 0:
-                self.bought[symbol] = 'OUT'
+                self.bought[symbol] = self.OUT
 
             number_of_bars = self.bars.get_number_of_bars(symbol)
 
@@ -229,26 +225,26 @@ class EurUsdDailyForecastStrategy(Strategy):
             if prediction > 0 and ((sma_enabled and sma_short > sma_long) or not sma_enabled):
                 direction = 'LONG'
 
-                self.bought[symbol] = direction
+                self.bought[symbol] = self.LONG
 
                 stop_loss = self.calculate_stop_loss_price(bar_price, self.stop_loss_pips, direction)
                 take_profit = self.calculate_take_profit_price(bar_price, self.take_profit_pips, direction)
 
                 signal = SignalEvent(1, symbol, bar_date, datetime_now, direction, 1.0, stop_loss, take_profit)
-                self.events_per_symbol[symbol].put(signal)
+                self.events_per_symbol[symbol].append(signal)
 
                 return True
 
             if prediction < 0 and ((sma_enabled and sma_short < sma_long) or not sma_enabled):
                 direction = 'SHORT'
 
-                self.bought[symbol] = direction
+                self.bought[symbol] = self.SHORT
 
                 stop_loss = self.calculate_stop_loss_price(bar_price, self.stop_loss_pips, direction)
                 take_profit = self.calculate_take_profit_price(bar_price, self.take_profit_pips, direction)
 
                 signal = SignalEvent(1, symbol, bar_date, datetime_now, direction, 1.0, stop_loss, take_profit)
-                self.events_per_symbol[symbol].put(signal)
+                self.events_per_symbol[symbol].append(signal)
 
                 return True
 
@@ -262,9 +258,9 @@ class EurUsdDailyForecastStrategy(Strategy):
                 ((prediction > 0 and current_position.is_short()) or (prediction < 0 and current_position.is_long())):
             signal = SignalEvent(1, symbol, bar_date, datetime_now, 'EXIT', 1.0, None, None,
                                  current_position.get_trade_id())
-            self.events_per_symbol[symbol].put(signal)
+            self.events_per_symbol[symbol].append(signal)
 
-            self.bought[symbol] = 'OUT'
+            self.bought[symbol] = self.OUT
 
             return True
 
@@ -6,13 +6,137 @@ import argparser_tools.basic
 from events.signal_event import SignalEvent
 from strategies.strategy import Strategy
 from typing import Dict
+from collections import deque
 from datahandlers.data_handler import DataHandler
 from core.portfolio import Portfolio
 
+
 try:
-    import Queue as queue
+    from numba import njit
 except ImportError:
-    import queue
+    # Numba is optional, without it the kernels below run as plain Python
+    def njit(*args, **kwargs):
+        def decorator(function):
+            return function
+
+        return decorator
+
+try:
+    from numpy.lib.stride_tricks import sliding_window_view
+except ImportError:
+    # NumPy < 1.20
+    def sliding_window_view(x, window_shape):
+        return np.lib.stride_tricks.as_strided(x, shape=(len(x) - window_shape + 1, window_shape),
+                                               strides=(x.strides[0], x.strides[0]), writeable=False)
+
+_OUT = Strategy.OUT
+_LONG = Strategy.LONG
+_SHORT = Strategy.SHORT
+
+_DIRECTION_NONE = 0
+_DIRECTION_LONG = 1
+_DIRECTION_SHORT = -1
+_DIRECTION_EXIT_LONG = 2
+_DIRECTION_EXIT_SHORT = -2
+
+_SIGNAL_TYPES = {
+    _DIRECTION_LONG: 'LONG',
+    _DIRECTION_SHORT: 'SHORT',
+    _DIRECTION_EXIT_LONG: 'EXIT',
+    _DIRECTION_EXIT_SHORT: 'EXIT',
+}
+
+# SMAs closer than this (relatively) are compared again on freshly summed windows, running sums carry rounding errors
+_TIE_TOLERANCE = 1e-9
+
+
+@njit(cache=True)
+def _window_sum(ring, index, count, window_length):
+    """
+    Sums the last window_length prices of the ring row, newest first.
+    """
+    window = ring.shape[1]
+    total = 0.0
+
+    for k in range(min(count, window_length)):
+        total += ring[index, (count - 1 - k) % window]
+
+    return total
+
+
+@njit(cache=True)
+def _series_window_sum(values, end, window_length):
+    """
+    Sums window_length values ending at end, newest first (the same order as _window_sum).
+    """
+    total = 0.0
+
+    for k in range(window_length):
+        total += values[end - k]
+
+    return total
+
+
+@njit(cache=True)
+def _push_price(ring, count, short_sum, long_sum, index, price, short_window, long_window):
+    """
+    Shifts the price into the ring row of the symbol, keeping
+    the sums of the short and long windows up to date in O(1).
+    """
+    window = ring.shape[1]
+    position = count[index] % window
+
+    if count[index] >= short_window:
+        short_sum[index] -= ring[index, (position - short_window) % window]
+    if count[index] >= long_window:
+        long_sum[index] -= ring[index, (position - long_window) % window]
+
+    ring[index, position] = price
+    count[index] += 1
+    short_sum[index] += price
+    long_sum[index] += price
+
+    # Re-sum the windows once per ring turn so rounding errors do not accumulate, and while
+    # a NaN price (e.g. padded data) poisons a running sum
+    if position == window - 1 or np.isnan(short_sum[index]):
+        short_sum[index] = _window_sum(ring, index, count[index], short_window)
+    if position == window - 1 or np.isnan(long_sum[index]):
+        long_sum[index] = _window_sum(ring, index, count[index], long_window)
+
+
+@njit(cache=True)
+def _mac_step(ring, count, short_sum, long_sum, bought, index, price, short_window, long_window):
+    """
+    Pushes the latest price of the symbol and evaluates the crossover
+    of both SMAs against its market state. Returns one of the
+    _DIRECTION_* codes and updates bought accordingly.
+    """
+    _push_price(ring, count, short_sum, long_sum, index, price, short_window, long_window)
+
+    if count[index] < ring.shape[1]:
+        return _DIRECTION_NONE
+
+    short_sma = short_sum[index] / short_window
+    long_sma = long_sum[index] / long_window
+
+    if abs(short_sma - long_sma) <= _TIE_TOLERANCE * abs(long_sma):
+        short_sma = _window_sum(ring, index, count[index], short_window) / short_window
+        long_sma = _window_sum(ring, index, count[index], long_window) / long_window
+
+    if short_sma > long_sma and bought[index] == _OUT:
+        bought[index] = _LONG
+        return _DIRECTION_LONG
+    elif short_sma < long_sma and bought[index] == _OUT:
+        bought[index] = _SHORT
+        return _DIRECTION_SHORT
+    elif short_sma < long_sma and bought[index] == _LONG:
+        bought[index] = _OUT
+        return _DIRECTION_EXIT_LONG
+    elif short_sma > long_sma and bought[index] == _SHORT:
+        bought[index] = _OUT
+        return _DIRECTION_EXIT_SHORT
+
+    return _DIRECTION_NONE
 
 
 class MovingAverageCrossStrategy(Strategy):
@@ -23,7 +147,7 @@ class MovingAverageCrossStrategy(Strategy):
     """
 
     def __init__(
-            self, bars: DataHandler, portfolio: Portfolio, events_per_symbol: Dict[str, queue.Queue],
+            self, bars: DataHandler, portfolio: Portfolio, events_per_symbol: Dict[str, deque],
             short_window: int = 3, long_window: int = 45,
             stop_loss_pips=None, take_profit_pips=None
     ):
@@ -47,19 +171,78 @@ class MovingAverageCrossStrategy(Strategy):
         self.stop_loss_pips = stop_loss_pips
         self.take_profit_pips = take_profit_pips
 
-        # Set to True if a symbol is in the market
-        self.bought = self._calculate_initial_bought()
+        # Price distances of stop loss and take profit from the entry price, None when not used
+        self._stop_loss_delta = stop_loss_pips * self.get_pip_value() if stop_loss_pips else None
+        self._take_profit_delta = take_profit_pips * self.get_pip_value() if take_profit_pips else None
+
+        # Rolling close prices of all symbols in one array (a row per symbol) with running sums of both windows
+        self._symbol_index = dict((s, i) for i, s in enumerate(self.symbol_list))
+        self._window = max(self.short_window, self.long_window)
+        self._ring = np.empty((len(self.symbol_list), self._window), dtype=np.float64)
+        self._count = np.zeros(len(self.symbol_list), dtype=np.int64)
+        self._short_sum = np.zeros(len(self.symbol_list), dtype=np.float64)
+        self._long_sum = np.zeros(len(self.symbol_list), dtype=np.float64)
+
+        # Market state of every symbol: _OUT, _LONG or _SHORT
+        self._bought = np.full(len(self.symbol_list), _OUT, dtype=np.int8)
+
+        # Directions for every bar of the symbols whose whole history is known up front (backtests)
+        self._precomputed_directions = {}
 
-    def _calculate_initial_bought(self):
+        for s in self.symbol_list:
+            closes = self.bars.get_all_bars_values(s, 'close_bid')
+
+            if closes is not None:
+                self._precomputed_directions[s] = self.precompute_directions(closes)
+
+    def precompute_directions(self, closes) -> np.ndarray:
         """
-        Adds keys to the bought dictionary for all symbols
-        and sets them to 'OUT'.
+        Calculates the _DIRECTION_* code of every bar from the whole
+        close price history of a symbol at once, giving the same
+        signals as feeding the bars one by one to calculate_signals.
         """
-        bought = {}
-        for s in self.symbol_list:
-            bought[s] = 'OUT'
+        closes = np.asarray(closes, dtype=np.float64)
+        directions = np.zeros(len(closes), dtype=np.int8)
+
+        if len(closes) < self._window:
+            return directions
+
+        # SMAs of every bar from the first one having both windows full
+        short_sma = sliding_window_view(closes, self.short_window).mean(axis=-1)[self._window - self.short_window:]
+        long_sma = sliding_window_view(closes, self.long_window).mean(axis=-1)[self._window - self.long_window:]
+
+        # Decide (near) ties the same way as the streaming kernel does
+        for k in np.flatnonzero(np.abs(short_sma - long_sma) <= _TIE_TOLERANCE * np.abs(long_sma)):
+            end = self._window - 1 + k
+            short_sma[k] = _series_window_sum(closes, end, self.short_window) / self.short_window
+            long_sma[k] = _series_window_sum(closes, end, self.long_window) / self.long_window
 
-        return bought
+        spread_sign = np.sign(short_sma - long_sma)
+
+        # The market state can only change where the sign of the spread changes or right after an exit
+        changes = np.flatnonzero(np.diff(spread_sign, prepend=0) != 0)
+        candidates = np.union1d(changes, changes + 1)
+
+        bought = _OUT
+        first_bar = self._window - 1
+
+        for k in candidates[candidates < len(spread_sign)]:
+            sign = spread_sign[k]
+
+            if sign > 0 and bought == _OUT:
+                bought = _LONG
+                directions[first_bar + k] = _DIRECTION_LONG
+            elif sign < 0 and bought == _OUT:
+                bought = _SHORT
+                directions[first_bar + k] = _DIRECTION_SHORT
+            elif sign < 0 and bought == _LONG:
+                bought = _OUT
+                directions[first_bar + k] = _DIRECTION_EXIT_LONG
+            elif sign > 0 and bought == _SHORT:
+                bought = _OUT
+                directions[first_bar + k] = _DIRECTION_EXIT_SHORT
+
+        return directions
 
     def calculate_signals(self, event):
         """
@@ -71,59 +254,67 @@ class MovingAverageCrossStrategy(Strategy):
         """
         if event.type == 'MARKET':
             s = event.symbol
+            i = self._symbol_index[s]
 
             if self.portfolio.current_positions[s] == 0:
-                self.bought[s] = 'OUT'
-
-            if self.bars.get_number_of_bars(s) >= max(self.long_window, self.short_window):
-                bars = self.bars.get_latest_bars_values(
-                    s, 'close_bid', N=self.long_window
-                )
-                bar_date = self.bars.get_latest_bar_datetime(s)
-                bar_price = self.bars.get_latest_bar_value(s, 'close_bid')
+                self._bought[i] = _OUT
 
-                if bars is not None and bars != []:
-                    short_sma = np.mean(bars[-self.short_window:])
-                    long_sma = np.mean(bars[-self.long_window:])
+            if s in self._precomputed_directions:
+                direction = self._precomputed_directions[s][self.bars.get_number_of_bars(s) - 1]
 
-                    symbol = s
-                    dt = datetime.datetime.utcnow()
+                if direction == _DIRECTION_NONE:
+                    return
 
-                    if short_sma > long_sma and self.bought[s] == 'OUT':
-                        sig_dir = 'LONG'
+                price = self.bars.get_latest_bar_value(s, 'close_bid')
+            else:
+                if self._count[i] == 0:
+                    # Seed the windows from the bars already available (e.g. preloaded history)
+                    prices = self.bars.get_latest_bars_values(s, 'close_bid', N=self._window)
 
-                        stop_loss = self.calculate_stop_loss_price(bar_price, self.stop_loss_pips, sig_dir)
-                        take_profit = self.calculate_take_profit_price(bar_price, self.take_profit_pips, sig_dir)
+                    if len(prices) == 0:
+                        return
 
-                        signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0, stop_loss, take_profit)
-                        self.events_per_symbol[symbol].put(signal)
+                    for price in prices[:-1]:
+                        _push_price(self._ring, self._count, self._short_sum, self._long_sum, i, price,
+                                    self.short_window, self.long_window)
 
-                        self.bought[s] = sig_dir
+                    price = prices[-1]
+                else:
+                    price = self.bars.get_latest_bar_value(s, 'close_bid')
 
-                    elif short_sma < long_sma and self.bought[s] == 'OUT':
-                        sig_dir = 'SHORT'
+                direction = _mac_step(self._ring, self._count, self._short_sum, self._long_sum, self._bought, i,
+                                      price, self.short_window, self.long_window)
 
-                        stop_loss = self.calculate_stop_loss_price(bar_price, self.stop_loss_pips, sig_dir)
-                        take_profit = self.calculate_take_profit_price(bar_price, self.take_profit_pips, sig_dir)
+                if direction == _DIRECTION_NONE:
+                    return
 
-                        signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0, stop_loss, take_profit)
-                        self.events_per_symbol[symbol].put(signal)
+            symbol = s
+            bar_date = self.bars.get_latest_bar_datetime(s)
+            bar_price = price
+            dt = datetime.datetime.utcnow()
 
-                        self.bought[s] = sig_dir
+            sig_dir = _SIGNAL_TYPES[direction]
 
-                    elif short_sma < long_sma and self.bought[s] == "LONG":
-                        sig_dir = 'EXIT'
+            if direction == _DIRECTION_LONG or direction == _DIRECTION_SHORT:
+                stop_loss = None
+                take_profit = None
 
-                        signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0)
-                        self.events_per_symbol[symbol].put(signal)
-                        self.bought[s] = 'OUT'
+                if direction == _DIRECTION_LONG:
+                    if self._stop_loss_delta is not None:
+                        stop_loss = bar_price - self._stop_loss_delta
+                    if self._take_profit_delta is not None:
+                        take_profit = bar_price + self._take_profit_delta
+                else:
+                    if self._stop_loss_delta is not None:
+                        stop_loss = bar_price + self._stop_loss_delta
+                    if self._take_profit_delta is not None:
+                        take_profit = bar_price - self._take_profit_delta
 
-                    elif short_sma > long_sma and self.bought[s] == "SHORT":
-                        sig_dir = 'EXIT'
+                signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0, stop_loss, take_profit)
+            else:
+                signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0)
 
-                        signal = SignalEvent(1, symbol, bar_date, dt, sig_dir, 1.0)
-                        self.events_per_symbol[symbol].put(signal)
-                        self.bought[s] = 'OUT'
+            self.events_per_symbol[symbol].append(signal)
 
     @staticmethod
     def get_strategy_params(args_namespace):
@@ -9,17 +9,13 @@ import argparse
 import urllib.request
 import json
 from typing import Dict
+from collections import deque
 from datetime import datetime
 from pytz import timezone
 
-try:
-    import Queue as queue
-except ImportError:
-    import queue
-
 
 class PinBarNotificationsStrategy(Strategy):
-    def __init__(self, bars: DataHandler, portfolio: Portfolio, events_per_symbol: Dict[str, queue.Queue],
+    def __init__(self, bars: DataHandler, portfolio: Portfolio, events_per_symbol: Dict[str, deque],
                  send_notifications: bool, webhook: str):
         self.bars = bars
         self.portfolio = portfolio
@@ -34,7 +30,7 @@ class PinBarNotificationsStrategy(Strategy):
     def _calculate_initial_bought(self) -> dict:
         bought = {}
         for s in self.bars.get_symbol_list():
-            bought[s] = 'OUT'
+            bought[s] = self.OUT
 
         return bought
 
@@ -2,11 +2,6 @@ from __future__ import print_function
 
 from abc import ABCMeta, abstractmethod
 
-try:
-    import Queue as queue
-except ImportError:
-    import queue
-
 
 class Strategy(object):
     """
@@ -21,6 +16,11 @@ class Strategy(object):
     """
     __metaclass__ = ABCMeta
 
+    # Market states of a symbol kept in the bought dictionaries of strategies
+    OUT = 0
+    LONG = 1
+    SHORT = 2
+
     @abstractmethod
     def calculate_signals(self, event):
         """
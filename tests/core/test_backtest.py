@@ -0,0 +1,80 @@
+import unittest
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from core.backtest import Backtest
+from core.configuration import Configuration
+from core.portfolio import Portfolio
+from datahandlers.data_handler_factory import DataHandlerFactory
+from datahandlers.historic_csv_data_handler import HistoricCSVDataHandler
+from executionhandlers.execution_handler_factory import ExecutionHandlerFactory
+from executionhandlers.simulated_execution import SimulatedExecutionHandler
+from positionsizehandlers.fixed_position_size import FixedPositionSize
+from strategies.mac import MovingAverageCrossStrategy
+
+
+class TestBacktest(unittest.TestCase):
+    symbol_list = ['eurusd', 'gbpusd', 'usdchf']
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+        for seed, symbol in enumerate(self.symbol_list):
+            TestBacktest._write_csv_file(os.path.join(self.directory, '%s.csv' % symbol), seed, 2000)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_symbols_run_in_threads_give_same_results_as_in_sequence(self):
+        backtest = self._create_backtest()
+
+        for symbol in self.symbol_list:
+            TestBacktest._run_symbols(backtest, [symbol])
+
+        expected = (backtest.get_signals(), backtest.get_orders(), backtest.get_fills())
+        self.assertNotEqual(0, backtest.get_orders())
+
+        for _ in range(3):
+            backtest = self._create_backtest()
+            TestBacktest._run_symbols(backtest, self.symbol_list)
+
+            self.assertEqual(expected, (backtest.get_signals(), backtest.get_orders(), backtest.get_fills()))
+
+    def _create_backtest(self) -> Backtest:
+        configuration = Configuration(data_handler_name=HistoricCSVDataHandler,
+                                      execution_handler_name=SimulatedExecutionHandler)
+        configuration.set_option(Configuration.OPTION_CSV_DIR, self.directory)
+
+        return Backtest(self.directory, self.symbol_list, 10000, 0, datetime(2017, 1, 1), configuration,
+                        DataHandlerFactory(), ExecutionHandlerFactory(), Portfolio, MovingAverageCrossStrategy,
+                        FixedPositionSize(0.5), None, [],
+                        dict(short_window=3, long_window=45, stop_loss_pips=20, take_profit_pips=20),
+                        'equity.csv', 'trades.csv')
+
+    @staticmethod
+    def _run_symbols(backtest, symbol_list):
+        # One thread per symbol, as Worker runs them
+        with contextlib.redirect_stdout(io.StringIO()), ThreadPoolExecutor(max_workers=len(symbol_list)) as executor:
+            for future in [executor.submit(backtest._run_symbol, symbol) for symbol in symbol_list]:
+                future.result()
+
+    @staticmethod
+    def _write_csv_file(path, seed, number_of_bars):
+        prices = 1.1 + np.cumsum(np.random.RandomState(seed).normal(0, 0.0005, number_of_bars))
+        opened_at = datetime(2017, 1, 2)
+
+        with open(path, 'w') as csv_file:
+            csv_file.write('header\nheader\nheader\n')
+
+            for price in prices:
+                csv_file.write('{};{:.5f};{:.5f};{:.5f};{:.5f};{:.5f};{:.5f};{:.5f};{:.5f};10\n'.format(
+                    opened_at.strftime('%Y-%m-%d %H:%M:%S'), price, price + 0.0001, price + 0.0002, price + 0.0003,
+                    price - 0.0002, price - 0.0001, price, price + 0.0001
+                ))
+
+                opened_at += timedelta(minutes=1)
@@ -0,0 +1,45 @@
+import unittest
+from collections import deque
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+from core.portfolio import Portfolio
+from core.position import Position
+
+
+class TestPortfolio(unittest.TestCase):
+
+    def test_equity_curve_with_known_number_of_bars(self):
+        self._assert_equity_curve(number_of_bars=10, number_of_updates=10)
+
+    def test_equity_curve_grows_with_unknown_number_of_bars(self):
+        self._assert_equity_curve(number_of_bars=None, number_of_updates=Portfolio.INITIAL_NUMBER_OF_ROWS + 5)
+
+    def _assert_equity_curve(self, number_of_bars, number_of_updates):
+        start_date = datetime(2017, 1, 2)
+        bars = MagicMock()
+        bars.symbol_list = ['eurusd']
+        bars.get_latest_bar_value.return_value = 1.5
+
+        portfolio = Portfolio(bars, {'eurusd': deque()}, start_date, 1000, None, None, None, None,
+                              number_of_bars=number_of_bars)
+        portfolio.current_positions['eurusd'] = Position('eurusd', 1, 100)
+        portfolio.current_holdings['cash'] = 850
+
+        for i in range(number_of_updates):
+            bars.get_latest_bar_datetime.return_value = start_date + timedelta(minutes=i + 1)
+            portfolio.update_timeindex()
+
+        self.assertEqual(number_of_updates + 1, portfolio.get_number_of_equity_rows())
+        # Asked again to check that reading the number of rows does not change it
+        self.assertEqual(number_of_updates + 1, portfolio.get_number_of_equity_rows())
+
+        portfolio.create_equity_curve_dataframe()
+        curve = portfolio.equity_curve
+
+        self.assertEqual(number_of_updates + 1, len(curve))
+        self.assertEqual(['eurusd', 'cash', 'commission', 'total', 'returns', 'equity_curve'], list(curve.columns))
+        self.assertEqual(start_date, curve.index[0])
+        self.assertEqual(1000, curve['total'].iloc[0])
+        self.assertEqual(start_date + timedelta(minutes=number_of_updates), curve.index[-1])
+        self.assertEqual(150, curve['eurusd'].iloc[-1])
+        self.assertEqual(1000, curve['total'].iloc[-1])
@@ -0,0 +1,97 @@
+import unittest
+import os
+import shutil
+import tempfile
+from collections import deque
+from datetime import datetime, timedelta
+from datahandlers.historic_csv_data_handler import HistoricCSVDataHandler
+
+
+class TestHistoricCSVDataHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.csv_dir = tempfile.mkdtemp()
+        self.prices = [1.1 + 0.0001 * i for i in range(10)]
+
+        TestHistoricCSVDataHandler._write_csv_file(os.path.join(self.csv_dir, 'eurusd.csv'), self.prices)
+
+    def tearDown(self):
+        shutil.rmtree(self.csv_dir)
+
+    def test_update_bars(self):
+        events_per_symbol = {'eurusd': deque()}
+        data_handler = HistoricCSVDataHandler(events_per_symbol, self.csv_dir, ['eurusd'])
+
+        for price in self.prices:
+            data_handler.update_bars('eurusd')
+            self.assertAlmostEqual(price, data_handler.get_latest_bar_value('eurusd', 'close_bid'))
+
+        data_handler.update_bars('eurusd')
+
+        self.assertFalse(data_handler.backtest_should_continue('eurusd'))
+        self.assertEqual(len(self.prices), len(events_per_symbol['eurusd']))
+        self.assertEqual(100, data_handler.get_position_in_percentage())
+
+    def test_all_bars_values(self):
+        data_handler = HistoricCSVDataHandler({'eurusd': deque()}, self.csv_dir, ['eurusd'])
+
+        self.assertEqual(len(self.prices), data_handler.get_total_number_of_bars())
+        self.assertEqual(self.prices, list(data_handler.get_all_bars_values('eurusd', 'close_bid')))
+
+    def test_unsorted_bars_are_sorted(self):
+        prices = list(reversed(self.prices))
+        TestHistoricCSVDataHandler._write_csv_file(os.path.join(self.csv_dir, 'eurusd.csv'), prices,
+                                                   minutes_per_bar=-1)
+        data_handler = HistoricCSVDataHandler({'eurusd': deque()}, self.csv_dir, ['eurusd'])
+
+        for price in self.prices:
+            data_handler.update_bars('eurusd')
+            self.assertAlmostEqual(price, data_handler.get_latest_bar_value('eurusd', 'close_bid'))
+
+        self.assertEqual(self.prices, list(data_handler.get_all_bars_values('eurusd', 'close_bid')))
+
+    def test_empty_volume_is_loaded(self):
+        csv_path = os.path.join(self.csv_dir, 'eurusd.csv')
+        TestHistoricCSVDataHandler._write_csv_file(csv_path, self.prices)
+
+        with open(csv_path) as csv_file:
+            lines = csv_file.readlines()
+
+        lines[4] = lines[4].rsplit(';', 1)[0] + ';\n'
+
+        with open(csv_path, 'w') as csv_file:
+            csv_file.writelines(lines)
+
+        data_handler = HistoricCSVDataHandler({'eurusd': deque()}, self.csv_dir, ['eurusd'])
+
+        for price in self.prices:
+            data_handler.update_bars('eurusd')
+            self.assertAlmostEqual(price, data_handler.get_latest_bar_value('eurusd', 'close_bid'))
+
+    def test_latest_bars_values_follow_new_bars(self):
+        data_handler = HistoricCSVDataHandler({'eurusd': deque()}, self.csv_dir, ['eurusd'])
+
+        data_handler.update_bars('eurusd')
+        data_handler.update_bars('eurusd')
+        first_values = data_handler.get_latest_bars_values('eurusd', 'close_bid', N=3)
+
+        data_handler.update_bars('eurusd')
+        second_values = data_handler.get_latest_bars_values('eurusd', 'close_bid', N=3)
+
+        self.assertEqual(2, len(first_values))
+        self.assertEqual(3, len(second_values))
+        self.assertAlmostEqual(self.prices[2], second_values[-1])
+
+    @staticmethod
+    def _write_csv_file(path, prices, minutes_per_bar=1):
+        opened_at = datetime(2017, 1, 2)
+
+        with open(path, 'w') as csv_file:
+            csv_file.write('header\nheader\nheader\n')
+
+            for price in prices:
+                csv_file.write('{};{:.5f};{:.5f};{:.5f};{:.5f};{:.5f};{:.5f};{:.5f};{:.5f};10\n'.format(
+                    opened_at.strftime('%Y-%m-%d %H:%M:%S'), price, price, price, price, price, price, price, price
+                ))
+
+                opened_at += timedelta(minutes=minutes_per_bar)
@@ -0,0 +1,17 @@
+import unittest
+from events.event_type import EventType
+from events.market_event import MarketEvent
+from events.order_event import OrderEvent
+
+
+class TestEventType(unittest.TestCase):
+
+    def test_type_id_matches_type(self):
+        self.assertEqual(EventType.MARKET, MarketEvent('EURUSD').type_id)
+        self.assertEqual(EventType.ORDER, OrderEvent('EURUSD', 'MKT', 100, 'BUY').type_id)
+
+    def test_type_id_follows_type_change(self):
+        event = OrderEvent('EURUSD', 'MKT', 100, 'BUY')
+        event.type = 'FILL'
+
+        self.assertEqual(EventType.FILL, event.type_id)
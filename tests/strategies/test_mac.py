@@ -0,0 +1,136 @@
+import unittest
+from unittest.mock import MagicMock
+import numpy as np
+from collections import deque
+from events.market_event import MarketEvent
+from strategies.mac import MovingAverageCrossStrategy
+
+
+class FakeBars(object):
+    def __init__(self, symbol_list, prices, whole_history_known=False):
+        self.symbol_list = symbol_list
+        self.prices = prices
+        self.whole_history_known = whole_history_known
+        self.latest = dict((symbol, []) for symbol in symbol_list)
+
+    def push(self, symbol, index):
+        self.latest[symbol].append(self.prices[symbol][index])
+
+    def get_symbol_list(self):
+        return self.symbol_list
+
+    def get_number_of_bars(self, symbol):
+        return len(self.latest[symbol])
+
+    def get_latest_bar_datetime(self, symbol):
+        return len(self.latest[symbol])
+
+    def get_latest_bar_value(self, symbol, val_type):
+        return self.latest[symbol][-1]
+
+    def get_latest_bars_values(self, symbol, val_type, N=1):
+        return np.array(self.latest[symbol][-N:])
+
+    def get_all_bars_values(self, symbol, val_type):
+        return np.array(self.prices[symbol]) if self.whole_history_known else None
+
+
+class TestMovingAverageCrossStrategy(unittest.TestCase):
+    symbol = 'EURUSD'
+    short_window = 3
+    long_window = 8
+
+    def test_signals_match_full_window_mean(self):
+        prices = TestMovingAverageCrossStrategy._create_prices(200)
+        strategy = self._create_strategy(prices)
+        events = strategy.events_per_symbol[self.symbol]
+
+        signals = []
+        for index in range(len(prices)):
+            strategy.bars.push(self.symbol, index)
+            strategy.calculate_signals(MarketEvent(self.symbol))
+
+            while events:
+                signal = events.popleft()
+                signals.append((signal.bar_datetime, signal.signal_type))
+
+        self.assertNotEqual([], signals)
+        self.assertEqual(self._calculate_expected_signals(prices), signals)
+
+    def test_precomputed_signals_match_streamed_signals(self):
+        # Constant stretches give exact ties of both SMAs
+        prices = TestMovingAverageCrossStrategy._create_prices(200) + [1.1] * 20 + \
+            TestMovingAverageCrossStrategy._create_prices(100)
+
+        streamed = self._run_strategy(self._create_strategy(prices, whole_history_known=False))
+        precomputed = self._run_strategy(self._create_strategy(prices, whole_history_known=True))
+
+        self.assertNotEqual([], streamed)
+        self.assertEqual([(s.bar_datetime, s.signal_type) for s in streamed],
+                         [(s.bar_datetime, s.signal_type) for s in precomputed])
+
+    def test_windows_are_seeded_from_preloaded_bars(self):
+        strategy = self._create_strategy(TestMovingAverageCrossStrategy._create_prices(60))
+
+        for index in range(20):
+            strategy.bars.push(self.symbol, index)
+
+        strategy.calculate_signals(MarketEvent(self.symbol))
+
+        self.assertEqual(1, len(strategy.events_per_symbol[self.symbol]))
+
+    def test_stop_loss_and_take_profit_prices(self):
+        prices = TestMovingAverageCrossStrategy._create_prices(60)
+        strategy = self._create_strategy(prices, stop_loss_pips=50, take_profit_pips=80)
+
+        signals = [signal for signal in self._run_strategy(strategy) if signal.signal_type != 'EXIT']
+        self.assertEqual(set(['LONG', 'SHORT']), set(signal.signal_type for signal in signals))
+
+        for signal in signals:
+            bar_price = prices[signal.bar_datetime - 1]
+
+            self.assertEqual(strategy.calculate_stop_loss_price(bar_price, 50, signal.signal_type), signal.stop_loss)
+            self.assertEqual(strategy.calculate_take_profit_price(bar_price, 80, signal.signal_type),
+                             signal.take_profit)
+
+    def _create_strategy(self, prices, whole_history_known=False, **params):
+        bars = FakeBars([self.symbol], {self.symbol: prices}, whole_history_known)
+        portfolio = MagicMock()
+        portfolio.current_positions = {self.symbol: None}
+
+        return MovingAverageCrossStrategy(bars, portfolio, {self.symbol: deque()}, short_window=self.short_window,
+                                          long_window=self.long_window, **params)
+
+    def _run_strategy(self, strategy):
+        for index in range(len(strategy.bars.prices[self.symbol])):
+            strategy.bars.push(self.symbol, index)
+            strategy.calculate_signals(MarketEvent(self.symbol))
+
+        return list(strategy.events_per_symbol[self.symbol])
+
+    def _calculate_expected_signals(self, prices):
+        signals = []
+        bought = 'OUT'
+
+        for index in range(self.long_window - 1, len(prices)):
+            short_sma = np.mean(prices[index - self.short_window + 1:index + 1])
+            long_sma = np.mean(prices[index - self.long_window + 1:index + 1])
+
+            if short_sma > long_sma and bought == 'OUT':
+                bought = 'LONG'
+                signals.append((index + 1, 'LONG'))
+            elif short_sma < long_sma and bought == 'OUT':
+                bought = 'SHORT'
+                signals.append((index + 1, 'SHORT'))
+            elif short_sma < long_sma and bought == 'LONG':
+                bought = 'OUT'
+                signals.append((index + 1, 'EXIT'))
+            elif short_sma > long_sma and bought == 'SHORT':
+                bought = 'OUT'
+                signals.append((index + 1, 'EXIT'))
+
+        return signals
+
+    @staticmethod
+    def _create_prices(number_of_prices):
+        return list(1.1 + 0.01 * np.sin(np.arange(number_of_prices) / 5.0))